@@ -1,9 +1,26 @@
 #!/usr/bin/env python3
 
+import fnmatch
 import os
+from pathlib import Path
+
 import nixl._utils as nixl_utils
 from nixl._api import nixl_agent, nixl_agent_config
 
+def query_plugin(agent, plugin):
+    """Collect (mem_types, params) for a plugin, each either the value or the raised exception"""
+    try:
+        mem_types = agent.get_plugin_mem_types(plugin)
+    except Exception as e:
+        mem_types = e
+    
+    try:
+        params = agent.get_plugin_params(plugin)
+    except Exception as e:
+        params = e
+    
+    return mem_types, params
+
 def check_nixl_installation():
     """Check NIXL installation and available plugins"""
     
@@ -15,9 +32,10 @@ def check_nixl_installation():
     print(f"   NIXL_PLUGIN_DIR: {nixl_plugin_dir}")
     
     if nixl_plugin_dir != "NOT SET":
-        if os.path.exists(nixl_plugin_dir):
+        plugin_root = Path(nixl_plugin_dir)
+        if plugin_root.is_dir():
             print(f"   ✓ Plugin directory exists")
-            plugins_in_dir = [f for f in os.listdir(nixl_plugin_dir) if f.endswith('.so')]
+            plugins_in_dir = [p.name for p in plugin_root.glob("*.so")]
             print(f"   Files in plugin directory: {plugins_in_dir}")
         else:
             print(f"   ✗ Plugin directory does not exist")
@@ -34,20 +52,21 @@ def check_nixl_installation():
         if not plugin_list:
             print("   ⚠ No plugins found!")
         else:
+            # Query everything first so printing isn't interleaved with FFI calls
+            plugin_details = [(plugin, *query_plugin(agent, plugin)) for plugin in plugin_list]
+            
             print("\n3. Plugin Details:")
-            for plugin in plugin_list:
+            for plugin, mem_types, params in plugin_details:
                 print(f"\n   Plugin: {plugin}")
-                try:
-                    mem_types = agent.get_plugin_mem_types(plugin)
+                if isinstance(mem_types, Exception):
+                    print(f"     Error getting memory types: {mem_types}")
+                else:
                     print(f"     Memory types: {mem_types}")
-                except Exception as e:
-                    print(f"     Error getting memory types: {e}")
                 
-                try:
-                    params = agent.get_plugin_params(plugin)
+                if isinstance(params, Exception):
+                    print(f"     Error getting parameters: {params}")
+                else:
                     print(f"     Parameters: {params}")
-                except Exception as e:
-                    print(f"     Error getting parameters: {e}")
         
         # Check if GDS is specifically missing
         if "GDS" not in plugin_list:
@@ -61,19 +80,22 @@ def check_nixl_installation():
             
             # Check for GDS-related files
             print("\n5. System GDS Check:")
-            gds_files = [
-                "/usr/lib/x86_64-linux-gnu/libnvidia-gds.so*",
-                "/usr/lib/x86_64-linux-gnu/libcufile.so*",
-                "/usr/lib/x86_64-linux-gnu/libcufile_rdma.so*"
+            lib_dir = Path("/usr/lib/x86_64-linux-gnu")
+            gds_patterns = [
+                "libnvidia-gds.so*",
+                "libcufile.so*",
+                "libcufile_rdma.so*"
             ]
             
-            for pattern in gds_files:
-                import glob
-                files = glob.glob(pattern)
+            # One directory listing, matched against every pattern
+            lib_names = [p.name for p in lib_dir.iterdir()] if lib_dir.is_dir() else []
+            
+            for pattern in gds_patterns:
+                files = [str(lib_dir / name) for name in fnmatch.filter(lib_names, pattern)]
                 if files:
                     print(f"   Found: {files}")
                 else:
-                    print(f"   Missing: {pattern}")
+                    print(f"   Missing: {lib_dir / pattern}")
         
     except Exception as e:
         print(f"   Error initializing NIXL agent: {e}")
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Host memory, file and backend helpers shared by the NIXL example scripts"""
+
+import ctypes
+import errno
+import os
+
+# O_DIRECT requires buffer address, length and file offset to be block aligned
+DIRECT_IO_ALIGNMENT = 4096
+
+_libc = ctypes.CDLL(None, use_errno=True)
+
+
+def malloc_aligned(size, alignment=DIRECT_IO_ALIGNMENT):
+    """
+    posix_memalign backed allocation, drop-in for nixl_utils.malloc_passthru
+    """
+    addr = ctypes.c_void_p()
+    ret = _libc.posix_memalign(ctypes.byref(addr), ctypes.c_size_t(alignment), ctypes.c_size_t(size))
+    if ret != 0:
+        raise MemoryError(f"posix_memalign({alignment}, {size}) failed: {os.strerror(ret)}")
+    return addr.value
+
+
+def free_aligned(addr):
+    """
+    Release memory obtained from malloc_aligned
+    """
+    _libc.free(ctypes.c_void_p(addr))
+
+
+def buffers_equal(addr1, addr2, size):
+    """
+    Compare two buffers with libc memcmp (vectorized) rather than byte by byte
+    """
+    return _libc.memcmp(ctypes.c_void_p(addr1), ctypes.c_void_p(addr2), ctypes.c_size_t(size)) == 0
+
+
+def open_file_noatime(file_path, flags):
+    """
+    os.open with O_NOATIME so reads don't dirty the inode, retried without it
+    when the caller doesn't own the file (EPERM)
+    """
+    try:
+        return os.open(file_path, flags | os.O_NOATIME)
+    except OSError as e:
+        if e.errno != errno.EPERM:
+            raise
+    return os.open(file_path, flags)
+
+
+def open_test_file(file_path, size):
+    """
+    Open the test file with O_DIRECT so transfers skip the page cache.
+    Falls back to buffered I/O on filesystems that reject O_DIRECT with EINVAL, and when
+    size (the bytes to transfer) isn't a DIRECT_IO_ALIGNMENT multiple, since the final
+    transfer would then have an unaligned length.
+    Returns (fd, direct).
+    """
+    if size % DIRECT_IO_ALIGNMENT:
+        print(f"⚠️  {size:,} bytes is not a multiple of {DIRECT_IO_ALIGNMENT}, using buffered I/O")
+        return open_buffered(file_path), False
+
+    try:
+        return open_file_noatime(file_path, os.O_RDWR | os.O_CREAT | os.O_DIRECT), True
+    except OSError as e:
+        if e.errno != errno.EINVAL:
+            raise
+
+    print("⚠️  O_DIRECT not supported for this file, falling back to buffered I/O")
+    return open_buffered(file_path), False
+
+
+def open_buffered(file_path):
+    """
+    Buffered fallback for open_test_file
+    """
+    fd = open_file_noatime(file_path, os.O_RDWR | os.O_CREAT)
+    # Readahead only pollutes the page cache for the write-then-read-back pattern
+    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_RANDOM)
+    return fd
+
+
+def gds_mt_params(agent, num_threads):
+    """
+    Backend params asking GDS_MT for num_threads workers, under whichever thread-count
+    key the plugin advertises. Empty (plugin defaults) if it advertises neither.
+    """
+    try:
+        defaults = agent.get_plugin_params("GDS_MT")
+    except Exception:
+        return {}
+    for key in ("thread_count", "num_threads"):
+        if key in defaults:
+            return {key: str(num_threads)}
+    return {}
@@ -19,16 +19,21 @@ import os
 import sys
 import time
 
+import numpy as np
+
 import nixl._utils as nixl_utils
 from nixl._api import nixl_agent, nixl_agent_config
 
+from nixl_bench_utils import DIRECT_IO_ALIGNMENT, free_aligned, malloc_aligned, open_test_file
+
 
-def run_batch_transfer(agent, write_addrs, read_addrs, file_path, buf_size, batch_size, total_size, original_file_size=None):
+def run_batch_transfer(agent, write_addrs, read_addrs, fd, buf_size, batch_size, total_size, original_file_size=None,
+                       direct_io=True):
     """
     Process file in batches to avoid resource exhaustion
     """
     num_batches = (total_size + batch_size - 1) // batch_size
-    buffers_per_batch = batch_size // buf_size
+    buffers_per_batch = (batch_size + buf_size - 1) // buf_size
     
     print(f"\n{'='*80}")
     print(f"Starting BATCH transfer processing")
@@ -39,84 +44,127 @@ def run_batch_transfer(agent, write_addrs, read_addrs, file_path, buf_size, batc
     print(f"Number of batches: {num_batches}")
     print(f"{'='*80}")
     
+    # buf_size/batch_size are fixed for the run, so batch offsets and sizes are
+    # derived once here and the pipelined loop below only indexes into them
+    batch_offsets = tuple(range(0, total_size, batch_size))
+    batch_sizes = tuple(min(batch_size, total_size - offset) for offset in batch_offsets)
+    
+    # Memory and file are registered once by the caller, descriptors for all
+    # batches are built here so the timed loop only submits and waits
+    batch_descs = build_batch_xfer_descs(agent, write_addrs, read_addrs, fd, buf_size, batch_offsets, batch_sizes)
+    
     overall_start = time.time()
-    all_write_times = []
-    all_read_times = []
-    
-    for batch_idx in range(num_batches):
-        batch_start = time.time()
-        batch_offset = batch_idx * batch_size
-        current_batch_size = min(batch_size, total_size - batch_offset)
-        current_buffers = (current_batch_size + buf_size - 1) // buf_size
+    # One slot per batch, filled in place and reduced with numpy at the end
+    write_times = np.empty(num_batches, dtype=np.float64)
+    read_times = np.empty(num_batches, dtype=np.float64)
+    
+    # Software pipeline: step N submits the WRITE of batch N together with the
+    # READ of batch N-1 (whose WRITE finished in the previous step). The two use
+    # disjoint DRAM buffers and file ranges, so they can be in flight together.
+    for step in range(num_batches + 1):
+        step_start = time.time()
+        write_batch = step if step < num_batches else None
+        read_batch = step - 1 if step > 0 else None
         
-        print(f"\n--- Processing Batch {batch_idx + 1}/{num_batches} ---")
-        print(f"Batch offset: {batch_offset:,} bytes")
-        print(f"Batch size: {current_batch_size:,} bytes")
-        print(f"Buffers in this batch: {current_buffers}")
+        print(f"\n--- Pipeline step {step + 1}/{num_batches + 1} ---")
         
-        # Process buffers in this batch using the working pattern
-        batch_write_times = []
-        batch_read_times = []
+        xfers = []
+        if write_batch is not None:
+            print(f"WRITE batch {write_batch + 1}/{num_batches}: offset {batch_offsets[write_batch]:,} bytes, "
+                  f"size {batch_sizes[write_batch]:,} bytes, {(batch_sizes[write_batch] + buf_size - 1) // buf_size} buffers")
+            write_descs, _, file_descs = batch_descs[write_batch]
+            xfers.append(("WRITE", write_batch, write_descs, file_descs))
+        if read_batch is not None:
+            print(f"READ  batch {read_batch + 1}/{num_batches}: offset {batch_offsets[read_batch]:,} bytes, "
+                  f"size {batch_sizes[read_batch]:,} bytes")
+            _, read_descs, file_descs = batch_descs[read_batch]
+            xfers.append(("READ", read_batch, read_descs, file_descs))
         
-        for buf_idx in range(current_buffers):
-            buffer_offset = batch_offset + (buf_idx * buf_size)
-            current_buf_size = min(buf_size, current_batch_size - (buf_idx * buf_size))
-            
-            # Use working single-buffer pattern
-            success, write_time, read_time = run_single_buffer_test(
-                agent, write_addrs[buf_idx], read_addrs[buf_idx], 
-                file_path, current_buf_size, buffer_offset
-            )
-            
-            if not success:
-                print(f"Failed to process buffer {buf_idx} in batch {batch_idx}")
-                return False
-                
-            batch_write_times.append(write_time)
-            batch_read_times.append(read_time)
-            
-            if buf_idx < 3:  # Show timing for first few buffers in each batch
-                print(f"  Buffer {buf_idx}: WRITE={write_time*1000:.2f}ms, READ={read_time*1000:.2f}ms")
+        submitted = []
+        for operation, batch_idx, local_descs, remote_descs in xfers:
+            submit_time = time.time()
+            xfer_handle = submit_xfer(agent, operation, local_descs, remote_descs)
+            if xfer_handle is None:
+                break
+            submitted.append((xfer_handle, operation, batch_idx, submit_time))
+        
+        # Drain whatever was posted even if a later submit failed, so no handle is
+        # released while its transfer is still in flight
+        done_times = wait_xfer(agent, [(xfer[0], xfer[1]) for xfer in submitted])
+        if len(submitted) < len(xfers):
+            done_times = None
         
-        batch_time = time.time() - batch_start
-        batch_total_write = sum(batch_write_times)
-        batch_total_read = sum(batch_read_times)
+        for xfer_handle, _, _, _ in submitted:
+            agent.release_xfer_handle(xfer_handle)
         
-        print(f"Batch {batch_idx + 1} completed in {batch_time*1000:.2f}ms")
-        print(f"  Batch WRITE: {batch_total_write*1000:.2f}ms, READ: {batch_total_read*1000:.2f}ms")
-        print(f"  Batch throughput: {(current_batch_size*2/batch_time)/(1024**2):.2f} MB/s")
+        if done_times is None:
+            print(f"Failed to process pipeline step {step + 1}")
+            return False
         
-        all_write_times.extend(batch_write_times)
-        all_read_times.extend(batch_read_times)
+        step_bytes = 0
+        for (_, operation, batch_idx, submit_time), done_time in zip(submitted, done_times):
+            elapsed = done_time - submit_time
+            step_bytes += batch_sizes[batch_idx]
+            if operation == "WRITE":
+                write_times[batch_idx] = elapsed
+            else:
+                read_times[batch_idx] = elapsed
+            print(f"  {operation} batch {batch_idx + 1}: {elapsed*1000:.2f}ms")
+        
+        if read_batch is not None and not direct_io:
+            # Drop the finished batch's pages so stale file data doesn't pile up in the page cache
+            os.posix_fadvise(fd, batch_offsets[read_batch], batch_sizes[read_batch], os.POSIX_FADV_DONTNEED)
+        
+        step_time = time.time() - step_start
+        
+        print(f"Step {step + 1} completed in {step_time*1000:.2f}ms")
+        print(f"  Step throughput: {(step_bytes/step_time)/(1024**2):.2f} MB/s")
     
     overall_time = time.time() - overall_start
     
+    print_performance_summary(
+        write_times, read_times, overall_time, total_size, buf_size,
+        f"{buffers_per_batch} per transfer, WRITE of batch N+1 overlapped with READ of batch N", original_file_size
+    )
+    
+    return True
+
+
+def print_performance_summary(write_times, read_times, overall_time, total_size, buf_size,
+                              parallel_desc, original_file_size=None, memory_label="GPU"):
+    """
+    Print the summary shared by all backends from per-batch WRITE/READ times.
+    memory_label names the transfer's memory side in the WRITE/READ headings.
+    """
+    total_buffers = (total_size + buf_size - 1) // buf_size
+    
     # Performance Summary
-    total_write_time = sum(all_write_times)
-    total_read_time = sum(all_read_times)
+    total_write_time = float(write_times.sum())
+    total_read_time = float(read_times.sum())
     
     print(f"\n{'='*80}")
     print(f"PERFORMANCE SUMMARY (BATCH PROCESSING)")
     print(f"{'='*80}")
     print(f"Total data processed: {total_size:,} bytes ({total_size/(1024**3):.2f} GB)")
-    print(f"Total buffers processed: {len(all_write_times):,}")
-    print(f"Parallel buffer transfers: 1 (sequential execution)")
+    print(f"Total buffers processed: {total_buffers:,}")
+    print(f"Parallel buffer transfers: {parallel_desc}")
     print(f"")
-    print(f"WRITE Operations (GPU to Disk):")
+    print(f"WRITE Operations ({memory_label} to Disk):")
     print(f"  Total WRITE time: {total_write_time*1000:.2f} ms")
-    print(f"  Average WRITE time per buffer: {(total_write_time/len(all_write_times))*1000:.2f} ms")
+    print(f"  Average WRITE time per batch: {float(write_times.mean())*1000:.2f} ms")
     print(f"  WRITE throughput: {(total_size/total_write_time)/(1024**2):.2f} MB/s")
     print(f"")
-    print(f"READ Operations (Disk to GPU):")
+    print(f"READ Operations (Disk to {memory_label}):")
     print(f"  Total READ time: {total_read_time*1000:.2f} ms")
-    print(f"  Average READ time per buffer: {(total_read_time/len(all_read_times))*1000:.2f} ms")
+    print(f"  Average READ time per batch: {float(read_times.mean())*1000:.2f} ms")
     print(f"  READ throughput: {(total_size/total_read_time)/(1024**2):.2f} MB/s")
     print(f"")
-    print(f"Overall Performance:")
+    # WRITE and READ transfers can overlap, so their summed times may exceed the wall
+    # time; overall figures are therefore wall clock only
+    print(f"Overall Performance (wall clock):")
     print(f"  Total time (all operations): {overall_time*1000:.2f} ms ({overall_time:.2f} seconds)")
     print(f"  Combined throughput: {(total_size*2/overall_time)/(1024**2):.2f} MB/s")
-    print(f"  Total sum of individual transfers: {(total_write_time+total_read_time)*1000:.2f} ms")
-    print(f"  Overhead time: {(overall_time-(total_write_time+total_read_time))*1000:.2f} ms")
+    print(f"  Sum of individual transfer times: {(total_write_time+total_read_time)*1000:.2f} ms")
     
     # Add 5GB estimation if we processed less than the full file
     if original_file_size and original_file_size > total_size:
@@ -127,23 +175,15 @@ def run_batch_transfer(agent, write_addrs, read_addrs, file_path, buf_size, batc
         full_file_gb = original_file_size / (1024**3)
         scale_factor = original_file_size / total_size
         
-        # Estimate based on current performance
+        # Estimate based on current performance; the total scales the measured wall
+        # time, which already accounts for any WRITE/READ overlap
         estimated_write_time = total_write_time * scale_factor
         estimated_read_time = total_read_time * scale_factor
-        estimated_transfer_time = estimated_write_time + estimated_read_time
-        
-        # Estimate overhead scaling (overhead per batch + setup)
-        batches_processed = len(all_write_times) // (batch_size // buf_size)
-        overhead_per_batch = (overall_time - (total_write_time + total_read_time)) / batches_processed
-        total_batches_needed = (original_file_size + batch_size - 1) // batch_size
-        estimated_overhead = overhead_per_batch * total_batches_needed
-        
-        estimated_total_time = estimated_transfer_time + estimated_overhead
+        estimated_total_time = overall_time * scale_factor
         
         print(f"  Full file size: {original_file_size:,} bytes ({full_file_gb:.2f} GB)")
         print(f"  Estimated WRITE time: {estimated_write_time*1000:.0f} ms ({estimated_write_time:.2f}s)")
         print(f"  Estimated READ time: {estimated_read_time*1000:.0f} ms ({estimated_read_time:.2f}s)")
-        print(f"  Estimated overhead: {estimated_overhead*1000:.0f} ms ({estimated_overhead:.2f}s)")
         print(f"  Estimated total time: {estimated_total_time*1000:.0f} ms ({estimated_total_time:.2f}s)")
         print(f"  Estimated combined throughput: {(original_file_size*2/estimated_total_time)/(1024**2):.0f} MB/s")
         
@@ -158,88 +198,424 @@ def run_batch_transfer(agent, write_addrs, read_addrs, file_path, buf_size, batc
         print(f"  → Full 5GB processing would take approximately: {time_str}")
     
     print(f"{'='*80}")
+
+
+def build_batch_xfer_descs(agent, write_addrs, read_addrs, fd, buf_size, batch_offsets, batch_sizes):
+    """
+    Build multi-entry transfer descriptors for every batch ahead of time.
+    Returns a list of (write_descs, read_descs, file_descs), one per batch.
+    DRAM lists only depend on the batch size, so full batches share one pair.
+    """
+    dram_descs_by_size = {}
+    batch_descs = []
+    
+    for batch_offset, current_batch_size in zip(batch_offsets, batch_sizes):
+        buf_sizes = [min(buf_size, current_batch_size - offset)
+                     for offset in range(0, current_batch_size, buf_size)]
+        
+        if current_batch_size not in dram_descs_by_size:
+            dram_descs_by_size[current_batch_size] = (
+                agent.get_xfer_descs([(write_addrs[i], size, 0) for i, size in enumerate(buf_sizes)], "DRAM"),
+                agent.get_xfer_descs([(read_addrs[i], size, 0) for i, size in enumerate(buf_sizes)], "DRAM"),
+            )
+        write_descs, read_descs = dram_descs_by_size[current_batch_size]
+        
+        file_descs = agent.get_xfer_descs(
+            [(batch_offset + i * buf_size, size, fd) for i, size in enumerate(buf_sizes)], "FILE"
+        )
+        batch_descs.append((write_descs, read_descs, file_descs))
+    
+    return batch_descs
+
+
+def submit_xfer(agent, operation, local_descs, remote_descs):
+    """
+    Create and post a transfer without waiting for it, returns the handle
+    """
+    xfer_handle = agent.initialize_xfer(operation, local_descs, remote_descs, "GDSTester")
+    if not xfer_handle:
+        print(f"Creating {operation.lower()} transfer failed.")
+        return None
+    
+    if agent.transfer(xfer_handle) == "ERR":
+        print(f"Posting {operation.lower()} transfer failed.")
+        agent.release_xfer_handle(xfer_handle)
+        return None
+    
+    return xfer_handle
+
+
+def wait_xfer(agent, xfers):
+    """
+    Drain posted (xfer_handle, operation) transfers, checking every pending handle
+    once per sweep. Returns the completion time of each transfer, or None on error.
+    Even after an error it keeps polling until every handle has left PROC, so the
+    caller can safely release all of them.
+    """
+    done_times = [None] * len(xfers)
+    failed = False
+    pending = list(range(len(xfers)))
+    while pending:
+        still_pending = []
+        for i in pending:
+            xfer_handle, operation = xfers[i]
+            state = agent.check_xfer_state(xfer_handle)
+            if state == "ERR":
+                print(f"{operation.capitalize()} transfer got to Error state.")
+                failed = True
+            elif state == "DONE":
+                done_times[i] = time.time()
+            else:
+                still_pending.append(i)
+        
+        pending = still_pending
+        if pending:
+            time.sleep(0)  # Yield between sweeps instead of spinning
+    
+    return None if failed else done_times
+
+
+def run_batch_transfer_kvikio(file_path, buf_size, batch_size, total_size, original_file_size=None):
+    """
+    Same batch loop as run_batch_transfer, but with device buffers driven
+    directly through cuFile by kvikio (GPU <-> disk, no DRAM bounce buffer)
+    """
+    # kvikio reads its thread pool size at import time
+    os.environ.setdefault("KVIKIO_NTHREADS", str(os.cpu_count()))
+    import cupy
+    import kvikio
+    
+    num_batches = (total_size + batch_size - 1) // batch_size
+    # Ceil, so a partial last buffer in a batch still gets its own slot
+    buffers_per_batch = (batch_size + buf_size - 1) // buf_size
+    
+    print(f"\n{'='*80}")
+    print(f"Starting BATCH transfer processing (kvikio)")
+    print(f"Total file size: {total_size:,} bytes ({total_size/(1024**3):.2f} GB)")
+    print(f"Batch size: {batch_size:,} bytes ({batch_size/(1024**2):.1f} MB)")
+    print(f"Buffer size: {buf_size:,} bytes ({buf_size/(1024**2):.1f} MB)")
+    print(f"Buffers per batch: {buffers_per_batch}")
+    print(f"Number of batches: {num_batches}")
+    print(f"kvikio threads: {os.environ['KVIKIO_NTHREADS']}")
+    print(f"{'='*80}")
+    
+    # Device buffers, write buffers carry the same 0xba pattern as the NIXL path
+    write_bufs = [cupy.full(buf_size, 0xba, dtype=cupy.uint8) for _ in range(buffers_per_batch)]
+    read_bufs = [cupy.empty(buf_size, dtype=cupy.uint8) for _ in range(buffers_per_batch)]
+    
+    overall_start = time.time()
+    write_times = np.empty(num_batches, dtype=np.float64)
+    read_times = np.empty(num_batches, dtype=np.float64)
+    
+    # "r+" keeps the existing file contents and size
+    with kvikio.CuFile(file_path, "r+") as f:
+        for batch_idx in range(num_batches):
+            batch_start = time.time()
+            batch_offset = batch_idx * batch_size
+            current_batch_size = min(batch_size, total_size - batch_offset)
+            current_buffers = (current_batch_size + buf_size - 1) // buf_size
+            
+            print(f"\n--- Processing Batch {batch_idx + 1}/{num_batches} ---")
+            print(f"Batch offset: {batch_offset:,} bytes")
+            print(f"Batch size: {current_batch_size:,} bytes")
+            print(f"Buffers in this batch: {current_buffers}")
+            
+            buffer_offsets = [batch_offset + (buf_idx * buf_size) for buf_idx in range(current_buffers)]
+            buffer_sizes = [min(buf_size, current_batch_size - (buf_idx * buf_size)) for buf_idx in range(current_buffers)]
+            
+            # Issue every buffer as an independent future so the kvikio thread
+            # pool keeps many cuFile requests in flight, then wait as a group
+            write_start = time.time()
+            futures = [
+                f.pwrite(write_bufs[buf_idx], size=buffer_sizes[buf_idx], file_offset=buffer_offsets[buf_idx])
+                for buf_idx in range(current_buffers)
+            ]
+            for future in futures:
+                future.get()
+            write_time = time.time() - write_start
+            
+            read_start = time.time()
+            futures = [
+                f.pread(read_bufs[buf_idx], size=buffer_sizes[buf_idx], file_offset=buffer_offsets[buf_idx])
+                for buf_idx in range(current_buffers)
+            ]
+            for future in futures:
+                future.get()
+            read_time = time.time() - read_start
+            
+            print(f"  Batch WRITE phase: {write_time*1000:.2f}ms, READ phase: {read_time*1000:.2f}ms")
+            
+            batch_time = time.time() - batch_start
+            
+            print(f"Batch {batch_idx + 1} completed in {batch_time*1000:.2f}ms")
+            print(f"  Batch throughput: {(current_batch_size*2/batch_time)/(1024**2):.2f} MB/s")
+            
+            write_times[batch_idx] = write_time
+            read_times[batch_idx] = read_time
+    
+    overall_time = time.time() - overall_start
+    
+    print_performance_summary(
+        write_times, read_times, overall_time, total_size, buf_size,
+        f"{buffers_per_batch} (kvikio futures per batch)", original_file_size
+    )
     
     return True
 
 
-def run_single_buffer_test(agent, write_addr, read_addr, file_path, buf_size, offset):
+def run_batch_transfer_uring(file_path, buf_size, batch_size, total_size, original_file_size=None):
     """
-    Run single buffer test using the exact working pattern
+    Same batch loop as run_batch_transfer, but bypassing NIXL/GDS and driving plain
+    file I/O through io_uring with registered buffers and a registered fd
     """
-    # Register memory
-    agent_strings = [(write_addr, buf_size, 0, "a"), (read_addr, buf_size, 0, "b")]
-    reg_descs = agent.get_reg_descs(agent_strings, "DRAM")
-    xfer1_descs = agent.get_xfer_descs([(write_addr, buf_size, 0)], "DRAM")
-    xfer2_descs = agent.get_xfer_descs([(read_addr, buf_size, 0)], "DRAM")
+    from liburing import (Cqe, FileIndex, IOSQE_FIXED_FILE, Iovec, Ring, io_uring_cq_advance,
+                          io_uring_cq_ready, io_uring_get_sqe, io_uring_prep_read, io_uring_prep_read_fixed,
+                          io_uring_prep_write, io_uring_prep_write_fixed, io_uring_queue_exit,
+                          io_uring_queue_init, io_uring_register_buffers, io_uring_register_files,
+                          io_uring_submit, io_uring_unregister_buffers, io_uring_unregister_files,
+                          io_uring_wait_cqe_nr)
     
-    assert agent.register_memory(reg_descs) is not None
+    num_batches = (total_size + batch_size - 1) // batch_size
+    # Ceil, so a partial last buffer in a batch still gets its own slot
+    buffers_per_batch = (batch_size + buf_size - 1) // buf_size
+    
+    print(f"\n{'='*80}")
+    print(f"Starting BATCH transfer processing (io_uring)")
+    print(f"Total file size: {total_size:,} bytes ({total_size/(1024**3):.2f} GB)")
+    print(f"Batch size: {batch_size:,} bytes ({batch_size/(1024**2):.1f} MB)")
+    print(f"Buffer size: {buf_size:,} bytes ({buf_size/(1024**2):.1f} MB)")
+    print(f"Buffers per batch: {buffers_per_batch}")
+    print(f"Number of batches: {num_batches}")
+    print(f"{'='*80}")
+    
+    # The Python liburing binding only accepts bytearray buffers, which are not
+    # page aligned, so O_DIRECT can't be used here and the file is opened buffered
+    write_bufs = [bytearray(b"\xba" * buf_size) for _ in range(buffers_per_batch)]
+    read_bufs = [bytearray(buf_size) for _ in range(buffers_per_batch)]
     
-    # Open file
     fd = os.open(file_path, os.O_RDWR | os.O_CREAT)
-    assert fd >= 0
-    
-    # Register file at specific offset
-    file_list = [(offset, buf_size, fd, "b")]
-    file_descs = agent.register_memory(file_list, "FILE")
-    assert file_descs is not None
-    xfer_files = file_descs.trim()
-    
-    # WRITE operation
-    write_start = time.time()
-    xfer_handle_1 = agent.initialize_xfer("WRITE", xfer1_descs, xfer_files, "GDSTester")
-    if not xfer_handle_1:
-        print("Creating write transfer failed.")
-        return False, 0, 0
-    
-    state = agent.transfer(xfer_handle_1)
-    assert state != "ERR"
-    
-    done = False
-    while not done:
-        state = agent.check_xfer_state(xfer_handle_1)
-        if state == "ERR":
-            print("Write transfer got to Error state.")
-            return False, 0, 0
-        elif state == "DONE":
-            done = True
-    
-    write_time = time.time() - write_start
-    
-    # READ operation  
-    read_start = time.time()
-    xfer_handle_2 = agent.initialize_xfer("READ", xfer2_descs, xfer_files, "GDSTester")
-    if not xfer_handle_2:
-        print("Creating read transfer failed.")
-        return False, 0, 0
-    
-    state = agent.transfer(xfer_handle_2)
-    assert state != "ERR"
-    
-    done = False
-    while not done:
-        state = agent.check_xfer_state(xfer_handle_2)
-        if state == "ERR":
-            print("Read transfer got to Error state.")
-            return False, 0, 0
-        elif state == "DONE":
-            done = True
-    
-    read_time = time.time() - read_start
+    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_RANDOM)
     
-    # Cleanup
-    agent.release_xfer_handle(xfer_handle_1)
-    agent.release_xfer_handle(xfer_handle_2)
-    agent.deregister_memory(reg_descs)
-    agent.deregister_memory(file_descs)
-    os.close(fd)
+    ring = Ring()
+    cqe = Cqe()
+    io_uring_queue_init(buffers_per_batch, ring)
+    
+    # Register buffers and fd once so the kernel doesn't pin pages and look up
+    # the file on every I/O. Registration counts against RLIMIT_MEMLOCK, so fall
+    # back to plain read/write SQEs if it is refused.
+    iovecs = Iovec(write_bufs + read_bufs)
+    files = FileIndex([fd])
+    try:
+        io_uring_register_buffers(ring, iovecs)
+        io_uring_register_files(ring, files)
+        registered = True
+    except OSError as e:
+        print(f"⚠️  io_uring buffer/file registration failed ({e}), using unregistered I/O")
+        registered = False
+    
+    def run_phase(operation, bufs, buf_index_base, batch_offset, current_batch_size):
+        """Queue one SQE per buffer, submit them with a single syscall and reap all CQEs"""
+        expected = []
+        # Short tail buffers must stay alive until their CQEs are reaped
+        tails = []
+        for buf_idx in range(len(bufs)):
+            buffer_offset = batch_offset + (buf_idx * buf_size)
+            if buffer_offset >= batch_offset + current_batch_size:
+                break
+            current_buf_size = min(buf_size, current_batch_size - (buf_idx * buf_size))
+            
+            sqe = io_uring_get_sqe(ring)
+            if current_buf_size == buf_size and registered:
+                if operation == "WRITE":
+                    io_uring_prep_write_fixed(sqe, 0, bufs[buf_idx], buf_index_base + buf_idx, buffer_offset)
+                else:
+                    io_uring_prep_read_fixed(sqe, 0, bufs[buf_idx], buf_index_base + buf_idx, buffer_offset)
+                sqe.flags |= IOSQE_FIXED_FILE
+            else:
+                # Short tail buffer (the fixed ops always use the full buffer length)
+                # or no registration: plain SQE on a buffer of the exact size
+                # (a slice copy, so a WRITE tail keeps the 0xba pattern)
+                tail = bufs[buf_idx] if current_buf_size == buf_size else bufs[buf_idx][:current_buf_size]
+                tails.append((buf_idx, tail))
+                if operation == "WRITE":
+                    io_uring_prep_write(sqe, fd, tail, buffer_offset)
+                else:
+                    io_uring_prep_read(sqe, fd, tail, buffer_offset)
+            expected.append(current_buf_size)
+        
+        io_uring_submit(ring)
+        
+        reaped = 0
+        success = True
+        while reaped < len(expected):
+            io_uring_wait_cqe_nr(ring, cqe, len(expected) - reaped)
+            ready = io_uring_cq_ready(ring)
+            for i in range(ready):
+                res = cqe[i].res
+                if res < 0:
+                    print(f"{operation.capitalize()} transfer failed: {os.strerror(-res)}")
+                    success = False
+            io_uring_cq_advance(ring, ready)
+            reaped += ready
+        
+        if operation == "READ":
+            for buf_idx, tail in tails:
+                if tail is not bufs[buf_idx]:
+                    bufs[buf_idx][:len(tail)] = tail
+        
+        return success
+    
+    overall_start = time.time()
+    write_times = np.empty(num_batches, dtype=np.float64)
+    read_times = np.empty(num_batches, dtype=np.float64)
+    success = True
+    
+    try:
+        for batch_idx in range(num_batches):
+            batch_start = time.time()
+            batch_offset = batch_idx * batch_size
+            current_batch_size = min(batch_size, total_size - batch_offset)
+            current_buffers = (current_batch_size + buf_size - 1) // buf_size
+            
+            print(f"\n--- Processing Batch {batch_idx + 1}/{num_batches} ---")
+            print(f"Batch offset: {batch_offset:,} bytes")
+            print(f"Batch size: {current_batch_size:,} bytes")
+            print(f"Buffers in this batch: {current_buffers}")
+            
+            write_start = time.time()
+            success = run_phase("WRITE", write_bufs, 0, batch_offset, current_batch_size)
+            write_time = time.time() - write_start
+            
+            read_start = time.time()
+            success = success and run_phase("READ", read_bufs, buffers_per_batch, batch_offset, current_batch_size)
+            read_time = time.time() - read_start
+            
+            if not success:
+                print(f"Failed to process batch {batch_idx}")
+                break
+            
+            # Keep the page cache from filling up with already processed batches
+            os.posix_fadvise(fd, batch_offset, current_batch_size, os.POSIX_FADV_DONTNEED)
+            
+            print(f"  Batch WRITE phase: {write_time*1000:.2f}ms, READ phase: {read_time*1000:.2f}ms")
+            
+            batch_time = time.time() - batch_start
+            
+            print(f"Batch {batch_idx + 1} completed in {batch_time*1000:.2f}ms")
+            print(f"  Batch throughput: {(current_batch_size*2/batch_time)/(1024**2):.2f} MB/s")
+            
+            write_times[batch_idx] = write_time
+            read_times[batch_idx] = read_time
+    finally:
+        if registered:
+            io_uring_unregister_files(ring)
+            io_uring_unregister_buffers(ring)
+        io_uring_queue_exit(ring)
+        os.close(fd)
+    
+    if not success:
+        return False
+    
+    overall_time = time.time() - overall_start
+    
+    print_performance_summary(
+        write_times, read_times, overall_time, total_size, buf_size,
+        f"{buffers_per_batch} (io_uring SQEs per submit)", original_file_size, memory_label="Host memory"
+    )
+    
+    return True
+
+
+def run_batch_transfer_nixl(file_path, buf_size, max_buffers_per_batch, batch_size, total_size, original_file_size=None):
+    """
+    Set up a GDS agent with registered DRAM buffers and file, then run the batch loop
+    """
+    print("Using NIXL Plugins from:")
+    print(os.environ["NIXL_PLUGIN_DIR"])
+
+    agent_config = nixl_agent_config(backends=[])
+    nixl_agent1 = nixl_agent("GDSTester", agent_config)
+
+    plugin_list = nixl_agent1.get_plugin_list()
+    assert "GDS" in plugin_list
+
+    print("Plugin parameters")
+    print(nixl_agent1.get_plugin_mem_types("GDS"))
+    print(nixl_agent1.get_plugin_params("GDS"))
+
+    nixl_agent1.create_backend("GDS")
+
+    print("\nLoaded backend parameters")
+    print(nixl_agent1.get_backend_mem_types("GDS"))
+    print(nixl_agent1.get_backend_params("GDS"))
+    print()
+
+    # Allocate buffers for one batch at a time
+    write_addrs = []
+    read_addrs = []
     
-    return True, write_time, read_time
+    for i in range(max_buffers_per_batch):
+        # Allocate write and read buffers
+        write_addr = malloc_aligned(buf_size)
+        read_addr = malloc_aligned(buf_size)
+        
+        # Initialize write buffer with test pattern
+        nixl_utils.ba_buf(write_addr, buf_size)
+        
+        write_addrs.append(write_addr)
+        read_addrs.append(read_addr)
+
+    # Register all buffers and the file once for the whole run
+    agent1_strings = [(addr, buf_size, 0, "a") for addr in write_addrs] + \
+                     [(addr, buf_size, 0, "b") for addr in read_addrs]
+    agent1_reg_descs = nixl_agent1.get_reg_descs(agent1_strings, "DRAM")
+    assert nixl_agent1.register_memory(agent1_reg_descs) is not None
+
+    agent1_fd, direct_io = open_test_file(file_path, total_size)
+    assert agent1_fd >= 0
+    print(f"File opened with {'O_DIRECT' if direct_io else 'buffered I/O'}")
+
+    agent1_file_descs = nixl_agent1.register_memory([(0, total_size, agent1_fd, "b")], "FILE")
+    assert agent1_file_descs is not None
+
+    # Run batch transfer
+    success = run_batch_transfer(
+        nixl_agent1, write_addrs, read_addrs, agent1_fd, buf_size, batch_size, total_size, original_file_size,
+        direct_io
+    )
+
+    # Cleanup
+    nixl_agent1.deregister_memory(agent1_reg_descs)
+    nixl_agent1.deregister_memory(agent1_file_descs)
+    os.close(agent1_fd)
+
+    for i in range(max_buffers_per_batch):
+        free_aligned(write_addrs[i])
+        free_aligned(read_addrs[i])
+
+    return success
 
 
 if __name__ == "__main__":
+    # Optional --backend=nixl|kvikio|uring flag, may appear anywhere on the command line
+    backend = "nixl"
+    for arg in sys.argv[1:]:
+        if arg.startswith("--backend="):
+            backend = arg.split("=", 1)[1].lower()
+    sys.argv = [arg for arg in sys.argv if not arg.startswith("--backend=")]
+    
+    if backend not in ("nixl", "kvikio", "uring"):
+        print(f"Unknown backend '{backend}', expected one of: nixl, kvikio, uring")
+        exit(1)
+    
     # Use moderate buffer sizes to balance performance and resource usage
     buf_size = 4 * 1024 * 1024  # 4 MB per buffer
     max_buffers_per_batch = 32  # Limit buffers per batch to avoid resource issues
+    if backend == "uring":
+        # io_uring gains the most on smaller I/Os, keep the same 128 MB batch
+        buf_size = 1024 * 1024
+        max_buffers_per_batch = 128
+    buf_size = -(-buf_size // DIRECT_IO_ALIGNMENT) * DIRECT_IO_ALIGNMENT  # Keep O_DIRECT aligned
     batch_size = max_buffers_per_batch * buf_size  # 128 MB per batch
     
     # Check for demo mode
@@ -248,11 +624,15 @@ if __name__ == "__main__":
         demo_mode = True
     
     if len(sys.argv) < 2:
-        print("Usage: python nixl_gds_example.py <file_path> [mode]")
+        print("Usage: python nixl_gds_example.py <file_path> [mode] [--backend=nixl|kvikio|uring]")
         print("  mode options:")
         print("    demo: Run only 3 buffer iterations for quick testing")
         print("    full: Process entire file (may cause resource exhaustion on large files)")
         print("    (none): Process up to 3 batches (384 MB) for safety")
+        print("  backend options:")
+        print("    nixl (default): NIXL GDS plugin with DRAM buffers")
+        print("    kvikio: cuFile through kvikio with device (cupy) buffers")
+        print("    uring: plain file I/O through io_uring (liburing), for systems without GDS")
         exit(0)
 
     # Get file size and calculate batches
@@ -291,52 +671,16 @@ if __name__ == "__main__":
         else:
             print(f"Processing {file_size:,} bytes ({file_size/(1024**2):.0f} MB) of the file.")
 
-    print("Using NIXL Plugins from:")
-    print(os.environ["NIXL_PLUGIN_DIR"])
-
-    agent_config = nixl_agent_config(backends=[])
-    nixl_agent1 = nixl_agent("GDSTester", agent_config)
-
-    plugin_list = nixl_agent1.get_plugin_list()
-    assert "GDS" in plugin_list
-
-    print("Plugin parameters")
-    print(nixl_agent1.get_plugin_mem_types("GDS"))
-    print(nixl_agent1.get_plugin_params("GDS"))
-
-    nixl_agent1.create_backend("GDS")
-
-    print("\nLoaded backend parameters")
-    print(nixl_agent1.get_backend_mem_types("GDS"))
-    print(nixl_agent1.get_backend_params("GDS"))
-    print()
-
-    # Allocate buffers for one batch at a time
-    write_addrs = []
-    read_addrs = []
-    
-    for i in range(max_buffers_per_batch):
-        # Allocate write and read buffers
-        write_addr = nixl_utils.malloc_passthru(buf_size)
-        read_addr = nixl_utils.malloc_passthru(buf_size)
-        
-        # Initialize write buffer with test pattern
-        nixl_utils.ba_buf(write_addr, buf_size)
-        
-        write_addrs.append(write_addr)
-        read_addrs.append(read_addr)
-
-    # Run batch transfer
-    success = run_batch_transfer(
-        nixl_agent1, write_addrs, read_addrs, sys.argv[1], buf_size, batch_size, file_size, original_file_size
-    )
+    if backend == "kvikio":
+        success = run_batch_transfer_kvikio(sys.argv[1], buf_size, batch_size, file_size, original_file_size)
+    elif backend == "uring":
+        success = run_batch_transfer_uring(sys.argv[1], buf_size, batch_size, file_size, original_file_size)
+    else:
+        success = run_batch_transfer_nixl(
+            sys.argv[1], buf_size, max_buffers_per_batch, batch_size, file_size, original_file_size
+        )
     
     if success:
         print(f"\n✓ Successfully processed entire {file_size/(1024**3):.2f} GB file!")
 
-    # Cleanup
-    for i in range(max_buffers_per_batch):
-        nixl_utils.free_passthru(write_addrs[i])
-        nixl_utils.free_passthru(read_addrs[i])
-
     print("\nTest Complete.")
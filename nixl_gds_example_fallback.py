@@ -17,10 +17,23 @@
 
 import os
 import sys
+import time
 
 import nixl._utils as nixl_utils
 from nixl._api import nixl_agent, nixl_agent_config
 
+from nixl_bench_utils import gds_mt_params
+
+def wait_for_xfer(agent, xfer_handle):
+    """Poll a posted transfer until it leaves the PROC state, yielding the CPU between checks"""
+    while True:
+        state = agent.check_xfer_state(xfer_handle)
+        if state == "ERR":
+            return False
+        elif state == "DONE":
+            return True
+        time.sleep(0)
+
 def run_gds_example():
     """Run GDS example with fallback to available plugins"""
     
@@ -40,8 +53,8 @@ def run_gds_example():
     plugin_list = nixl_agent1.get_plugin_list()
     print(f"Available plugins: {plugin_list}")
     
-    # Check if GDS is available
-    if "GDS" not in plugin_list:
+    # Check if GDS is available, preferring the multi-threaded GDS_MT plugin
+    if "GDS" not in plugin_list and "GDS_MT" not in plugin_list:
         print("\n⚠ GDS plugin not available!")
         print("This example requires NVIDIA GDS to be installed and NIXL to be built with GDS support.")
         print("\nTo install NVIDIA GDS:")
@@ -66,22 +79,27 @@ def run_gds_example():
             print("Exiting. Please install GDS and try again.")
             exit(1)
         
-        # Run basic test with available plugins
+        # Run basic test with available plugins, then exercise the file path without GDS
         run_basic_test(nixl_agent1, plugin_list[0] if plugin_list else None)
+        run_uring_test(sys.argv[1], buf_size)
         return
 
-    print("✓ GDS plugin found!")
+    backend = "GDS_MT" if "GDS_MT" in plugin_list else "GDS"
+    print(f"✓ {backend} plugin found!")
     
     # Continue with original GDS example
     print("Plugin parameters")
-    print(nixl_agent1.get_plugin_mem_types("GDS"))
-    print(nixl_agent1.get_plugin_params("GDS"))
+    print(nixl_agent1.get_plugin_mem_types(backend))
+    print(nixl_agent1.get_plugin_params(backend))
 
-    nixl_agent1.create_backend("GDS")
+    if backend == "GDS_MT":
+        nixl_agent1.create_backend(backend, gds_mt_params(nixl_agent1, min(os.cpu_count() or 1, 8)))
+    else:
+        nixl_agent1.create_backend(backend)
 
     print("\nLoaded backend parameters")
-    print(nixl_agent1.get_backend_mem_types("GDS"))
-    print(nixl_agent1.get_backend_params("GDS"))
+    print(nixl_agent1.get_backend_mem_types(backend))
+    print(nixl_agent1.get_backend_params(backend))
     print()
 
     # get DRAM buf and initialize it to 0xba for verification
@@ -119,16 +137,10 @@ def run_gds_example():
     state = nixl_agent1.transfer(xfer_handle_1)
     assert state != "ERR"
 
-    done = False
-
-    while not done:
-        state = nixl_agent1.check_xfer_state(xfer_handle_1)
-        if state == "ERR":
-            print("Transfer got to Error state.")
-            exit()
-        elif state == "DONE":
-            done = True
-            print("Initiator done")
+    if not wait_for_xfer(nixl_agent1, xfer_handle_1):
+        print("Transfer got to Error state.")
+        exit()
+    print("Initiator done")
 
     # read file data back into second buffer
     xfer_handle_2 = nixl_agent1.initialize_xfer(
@@ -141,16 +153,10 @@ def run_gds_example():
     state = nixl_agent1.transfer(xfer_handle_2)
     assert state != "ERR"
 
-    done = False
-
-    while not done:
-        state = nixl_agent1.check_xfer_state(xfer_handle_2)
-        if state == "ERR":
-            print("Transfer got to Error state.")
-            exit()
-        elif state == "DONE":
-            done = True
-            print("Initiator done")
+    if not wait_for_xfer(nixl_agent1, xfer_handle_2):
+        print("Transfer got to Error state.")
+        exit()
+    print("Initiator done")
 
     # transfer verification
     nixl_utils.verify_transfer(addr1, addr2, buf_size)
@@ -192,5 +198,102 @@ def run_basic_test(agent, plugin_name):
     except Exception as e:
         print(f"✗ Error testing plugin {plugin_name}: {e}")
 
+def run_uring_test(file_path, buf_size, num_buffers=32):
+    """Plain file WRITE/READ round trip through io_uring, for systems without GDS"""
+    try:
+        from liburing import (Cqe, IORING_SETUP_SQPOLL, Iovec, Ring, io_uring_cq_advance, io_uring_cq_ready,
+                              io_uring_get_sqe, io_uring_prep_read, io_uring_prep_read_fixed,
+                              io_uring_prep_write, io_uring_prep_write_fixed, io_uring_queue_exit,
+                              io_uring_queue_init, io_uring_register_buffers, io_uring_submit,
+                              io_uring_unregister_buffers, io_uring_wait_cqe_nr)
+    except ImportError:
+        print("liburing not installed (pip install liburing), skipping io_uring test")
+        return False
+    
+    print(f"\nRunning io_uring file test: {num_buffers} x {buf_size:,} byte buffers")
+    
+    # The Python liburing binding only takes bytearray buffers
+    write_bufs = [bytearray(b"\xba" * buf_size) for _ in range(num_buffers)]
+    read_bufs = [bytearray(buf_size) for _ in range(num_buffers)]
+    
+    fd = os.open(file_path, os.O_RDWR | os.O_CREAT)
+    
+    # SQPOLL lets a kernel thread pick up SQEs without an io_uring_enter per submit;
+    # older kernels only allow it with privileges, so fall back to a normal ring
+    ring = Ring()
+    try:
+        io_uring_queue_init(num_buffers, ring, IORING_SETUP_SQPOLL)
+        sqpoll = True
+    except OSError:
+        ring = Ring()
+        io_uring_queue_init(num_buffers, ring)
+        sqpoll = False
+    cqe = Cqe()
+    
+    try:
+        io_uring_register_buffers(ring, Iovec(write_bufs + read_bufs))
+        registered = True
+    except OSError as e:
+        print(f"⚠️  io_uring buffer registration failed ({e}), using unregistered I/O")
+        registered = False
+    
+    def run_phase(operation, bufs, buf_index_base):
+        """Queue one SQE per buffer, submit them all at once and reap every CQE"""
+        for buf_idx, buf in enumerate(bufs):
+            sqe = io_uring_get_sqe(ring)
+            offset = buf_idx * buf_size
+            if registered and operation == "WRITE":
+                io_uring_prep_write_fixed(sqe, fd, buf, buf_index_base + buf_idx, offset)
+            elif registered:
+                io_uring_prep_read_fixed(sqe, fd, buf, buf_index_base + buf_idx, offset)
+            elif operation == "WRITE":
+                io_uring_prep_write(sqe, fd, buf, offset)
+            else:
+                io_uring_prep_read(sqe, fd, buf, offset)
+        io_uring_submit(ring)
+        
+        success = True
+        reaped = 0
+        while reaped < len(bufs):
+            io_uring_wait_cqe_nr(ring, cqe, len(bufs) - reaped)
+            ready = io_uring_cq_ready(ring)
+            for i in range(ready):
+                if cqe[i].res != buf_size:
+                    res = cqe[i].res
+                    print(f"{operation} failed: {os.strerror(-res) if res < 0 else f'short transfer of {res} bytes'}")
+                    success = False
+            io_uring_cq_advance(ring, ready)
+            reaped += ready
+        return success
+    
+    try:
+        write_start = time.time()
+        success = run_phase("WRITE", write_bufs, 0)
+        write_time = time.time() - write_start
+        
+        read_start = time.time()
+        success = success and run_phase("READ", read_bufs, num_buffers)
+        read_time = time.time() - read_start
+    finally:
+        if registered:
+            io_uring_unregister_buffers(ring)
+        io_uring_queue_exit(ring)
+        os.close(fd)
+    
+    if not success:
+        print("✗ io_uring file test failed")
+        return False
+    
+    if read_bufs != write_bufs:
+        print("✗ io_uring read back data does not match what was written")
+        return False
+    
+    total = num_buffers * buf_size
+    print(f"  SQPOLL: {'on' if sqpoll else 'off'}, registered buffers: {'yes' if registered else 'no'}")
+    print(f"  WRITE: {write_time*1000:.2f} ms ({(total/write_time)/(1024**2):.2f} MB/s)")
+    print(f"  READ:  {read_time*1000:.2f} ms ({(total/read_time)/(1024**2):.2f} MB/s)")
+    print("✓ io_uring file test completed successfully!")
+    return True
+
 if __name__ == "__main__":
     run_gds_example() 
\ No newline at end of file
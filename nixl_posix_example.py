@@ -15,12 +15,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import ctypes
 import os
 import sys
+import time
 
-import nixl._utils as nixl_utils
 from nixl._api import nixl_agent, nixl_agent_config
 
+from nixl_bench_utils import buffers_equal, free_aligned, malloc_aligned, open_test_file
+
+def wait_for_xfer(agent, xfer_handle, operation_name):
+    """Wait for a posted transfer, backing off instead of spinning on check_xfer_state"""
+    delay = 5e-6
+    while True:
+        state = agent.check_xfer_state(xfer_handle)
+        if state == "ERR":
+            print(f"{operation_name} transfer got to Error state.")
+            exit(1)
+        if state == "DONE":
+            print(f"{operation_name} transfer completed")
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, 1e-3)
+
 def run_posix_example():
     """Run NIXL example using POSIX plugin for file operations"""
     
@@ -53,19 +70,30 @@ def run_posix_example():
     print(nixl_agent1.get_plugin_mem_types("POSIX"))
     print(nixl_agent1.get_plugin_params("POSIX"))
 
-    nixl_agent1.create_backend("POSIX")
+    # Prefer the io_uring engine of the POSIX plugin when it was built with it
+    if "use_uring" in nixl_agent1.get_plugin_params("POSIX"):
+        try:
+            nixl_agent1.create_backend("POSIX", {"use_uring": "true"})
+        except Exception as e:
+            print(f"io_uring POSIX backend unavailable ({e}), using default engine")
+            nixl_agent1.create_backend("POSIX")
+    else:
+        nixl_agent1.create_backend("POSIX")
 
     print("\nLoaded POSIX backend parameters")
     print(nixl_agent1.get_backend_mem_types("POSIX"))
     print(nixl_agent1.get_backend_params("POSIX"))
     print()
 
-    # Allocate DRAM buffers and initialize one with test pattern
-    addr1 = nixl_utils.malloc_passthru(buf_size)
-    addr2 = nixl_utils.malloc_passthru(buf_size)
-    nixl_utils.ba_buf(addr1, buf_size)  # Initialize with 0xba pattern
+    # Allocate both DRAM buffers as one block, registered once for all transfers,
+    # and initialize the first half with test pattern
+    # (4 KB aligned, as O_DIRECT requires; buf_size is a multiple of 4 KB too)
+    arena = malloc_aligned(2 * buf_size)
+    addr1 = arena
+    addr2 = arena + buf_size
+    ctypes.memset(addr1, 0xba, buf_size)  # Initialize with 0xba pattern
 
-    agent1_strings = [(addr1, buf_size, 0, "a"), (addr2, buf_size, 0, "b")]
+    agent1_strings = [(arena, 2 * buf_size, 0, "ab")]
 
     agent1_reg_descs = nixl_agent1.get_reg_descs(agent1_strings, "DRAM")
     agent1_xfer1_descs = nixl_agent1.get_xfer_descs([(addr1, buf_size, 0)], "DRAM")
@@ -75,7 +103,8 @@ def run_posix_example():
 
     # Open file for testing
     file_path = sys.argv[1]
-    agent1_fd = os.open(file_path, os.O_RDWR | os.O_CREAT)
+    agent1_fd, direct_io = open_test_file(file_path, buf_size)
+    print(f"File opened with {'O_DIRECT' if direct_io else 'buffered I/O'}")
     assert agent1_fd >= 0
 
     agent1_file_list = [(0, buf_size, agent1_fd, "b")]
@@ -98,15 +127,7 @@ def run_posix_example():
     state = nixl_agent1.transfer(xfer_handle_1)
     assert state != "ERR"
 
-    done = False
-    while not done:
-        state = nixl_agent1.check_xfer_state(xfer_handle_1)
-        if state == "ERR":
-            print("Write transfer got to Error state.")
-            exit(1)
-        elif state == "DONE":
-            done = True
-            print("Write transfer completed")
+    wait_for_xfer(nixl_agent1, xfer_handle_1, "Write")
 
     # Read data from file back to second DRAM buffer
     xfer_handle_2 = nixl_agent1.initialize_xfer(
@@ -119,19 +140,13 @@ def run_posix_example():
     state = nixl_agent1.transfer(xfer_handle_2)
     assert state != "ERR"
 
-    done = False
-    while not done:
-        state = nixl_agent1.check_xfer_state(xfer_handle_2)
-        if state == "ERR":
-            print("Read transfer got to Error state.")
-            exit(1)
-        elif state == "DONE":
-            done = True
-            print("Read transfer completed")
+    wait_for_xfer(nixl_agent1, xfer_handle_2, "Read")
 
     # Verify the transfer
     print("Verifying transfer...")
-    nixl_utils.verify_transfer(addr1, addr2, buf_size)
+    if not buffers_equal(addr1, addr2, buf_size):
+        print("✗ Transfer verification failed: read back data differs")
+        exit(1)
     print("✓ Transfer verification successful!")
 
     # Cleanup
@@ -140,8 +155,7 @@ def run_posix_example():
     nixl_agent1.deregister_memory(agent1_reg_descs)
     nixl_agent1.deregister_memory(agent1_file_descs)
 
-    nixl_utils.free_passthru(addr1)
-    nixl_utils.free_passthru(addr2)
+    free_aligned(arena)
 
     os.close(agent1_fd)
 
@@ -0,0 +1,100 @@
+import os
+import time
+
+import torch
+
+from nixl._api import nixl_agent, nixl_agent_config
+
+from without_nixl import create_inference_state
+
+# GPUDirect RDMA tuning for UCX (needs UCX built --with-cuda); must be set before
+# the agents create their UCX workers
+os.environ.setdefault("UCX_MEMTYPE_CACHE", "y")
+os.environ.setdefault("UCX_MAX_RNDV_RAILS", "4")
+
+
+def state_tensors(state):
+    # tensor2_slices are views of tensor2 and travel with it
+    tensors = []
+    for value in state.values():
+        tensors.append(value["tensor1"])
+        tensors.append(value["tensor2"])
+    return tensors
+
+
+def storage_regions(tensors):
+    # One registration per underlying allocation, however many tensors view it
+    regions = {}
+    for t in tensors:
+        storage = t.untyped_storage()
+        regions.setdefault(storage.data_ptr(), (storage.data_ptr(), storage.nbytes(), t.device.index, ""))
+    return list(regions.values())
+
+
+def empty_state_like(state):
+    received = {}
+    for key, value in state.items():
+        tensor2 = torch.empty_like(value["tensor2"])
+        received[key] = {
+            "tensor1": torch.empty_like(value["tensor1"]),
+            "tensor2": tensor2,
+            "tensor2_slices": {i: tensor2[i] for i in range(tensor2.size(0))},
+        }
+    return received
+
+
+def wait_for_xfer(initiator, target, xfer_handle, uuid):
+    init_done = False
+    target_done = False
+    while not (init_done and target_done):
+        if not init_done:
+            state = initiator.check_xfer_state(xfer_handle)
+            if state == "ERR":
+                raise RuntimeError("Transfer got to Error state.")
+            init_done = state == "DONE"
+
+        if not target_done:
+            target_done = target.check_remote_xfer_done("initiator", uuid)
+
+
+if __name__ == "__main__":
+    state = create_inference_state()
+    received = empty_state_like(state)
+
+    target = nixl_agent("target", nixl_agent_config(backends=["UCX"]))
+    initiator = nixl_agent("initiator", None)
+
+    # CUDA tensors give VRAM descriptors, so UCX moves them GPU to GPU without host staging
+    src_tensors = state_tensors(state)
+    dst_tensors = state_tensors(received)
+    src_reg_descs = initiator.get_reg_descs(storage_regions(src_tensors), "VRAM")
+    dst_reg_descs = target.get_reg_descs(storage_regions(dst_tensors), "VRAM")
+    assert initiator.register_memory(src_reg_descs) is not None
+    assert target.register_memory(dst_reg_descs) is not None
+
+    remote_name = initiator.add_remote_agent(target.get_agent_metadata())
+    xfer_handle = initiator.initialize_xfer(
+        "WRITE",
+        initiator.get_xfer_descs(src_tensors),
+        target.get_xfer_descs(dst_tensors),
+        remote_name,
+        b"STATE",
+    )
+    if not xfer_handle:
+        raise RuntimeError("Creating transfer failed.")
+
+    time_b = time.time()
+    state_xfer = initiator.transfer(xfer_handle)
+    assert state_xfer != "ERR"
+    wait_for_xfer(initiator, target, xfer_handle, b"STATE")
+    time_e = time.time()
+    print(f"time to transfer state with NIXL: {time_e - time_b:.2f} sec")
+
+    key = next(iter(state))
+    assert torch.equal(state[key]["tensor1"], received[key]["tensor1"])
+    assert torch.equal(state[key]["tensor2_slices"][0], received[key]["tensor2_slices"][0])
+
+    initiator.release_xfer_handle(xfer_handle)
+    initiator.remove_remote_agent(remote_name)
+    initiator.deregister_memory(src_reg_descs)
+    target.deregister_memory(dst_reg_descs)
@@ -24,6 +24,32 @@ import torch
 import nixl._utils as nixl_utils
 from nixl._api import nixl_agent, nixl_agent_config
 
+
+def wait_for_xfer(initiator, target, xfer_handle, uuid):
+    """
+    Drive both agents until the initiator reports DONE and the target saw the
+    notification. Both agents live in this process and only make progress when
+    polled, so this can't block on a completion fd; the transfers are a few
+    microseconds, so it polls the side still outstanding without sleeping.
+    """
+    init_done = False
+    target_done = False
+    while not (init_done and target_done):
+        if not init_done:
+            state = initiator.check_xfer_state(xfer_handle)
+            if state == "ERR":
+                print("Transfer got to Error state.")
+                exit()
+            elif state == "DONE":
+                init_done = True
+                print("Initiator done")
+
+        if not target_done:
+            if target.check_remote_xfer_done("initiator", uuid):
+                target_done = True
+                print("Target done")
+
+
 if __name__ == "__main__":
     buf_size = 256
     # Allocate memory and register with NIXL
@@ -56,8 +82,11 @@ if __name__ == "__main__":
     agent1_reg_descs = nixl_agent1.get_reg_descs(agent1_strings, "DRAM", is_sorted=True)
     agent1_xfer_descs = nixl_agent1.get_xfer_descs(agent1_addrs, "DRAM", is_sorted=True)
 
-    # Prefer numpy arrays for performance
-    agent1_addrs_np = np.array(agent1_addrs)
+    # Prefer numpy arrays for performance: built column-wise as uint64 (addr, len, dev_id)
+    # rows, so there are no per-row tuples and no dtype conversion in the bindings
+    agent1_addrs_np = np.zeros((2, 3), dtype=np.uint64)
+    agent1_addrs_np[:, 0] = (addr1, addr2)
+    agent1_addrs_np[:, 1] = buf_size
     agent1_xfer_descs_np = nixl_agent1.get_xfer_descs(
         agent1_addrs_np, "DRAM", is_sorted=True
     )
@@ -108,37 +137,21 @@ if __name__ == "__main__":
         exit()
 
     # test multiple postings
-    transfer_start_time = time.time()
+    transfer_start_time = time.perf_counter_ns()
     for i in range(2):
-        transfer_iter_start = time.time()
+        transfer_iter_start = time.perf_counter_ns()
         state = nixl_agent2.transfer(xfer_handle_1)
         assert state != "ERR"
 
-        target_done = False
-        init_done = False
-
-        while (not init_done) or (not target_done):
-            if not init_done:
-                state = nixl_agent2.check_xfer_state(xfer_handle_1)
-                if state == "ERR":
-                    print("Transfer got to Error state.")
-                    exit()
-                elif state == "DONE":
-                    init_done = True
-                    print("Initiator done")
-
-            if not target_done:
-                if nixl_agent1.check_remote_xfer_done("initiator", b"UUID1"):
-                    target_done = True
-                    print("Target done")
+        wait_for_xfer(nixl_agent2, nixl_agent1, xfer_handle_1, b"UUID1")
         
-        transfer_iter_end = time.time()
-        transfer_time = transfer_iter_end - transfer_iter_start
+        transfer_iter_end = time.perf_counter_ns()
+        transfer_time = (transfer_iter_end - transfer_iter_start) * 1e-9
         data_size = 512  # 2 buffers * 256 bytes each
         bandwidth = (data_size / transfer_time) / (1024 * 1024)  # MB/s
         print(f"Transfer 1 iteration {i+1}: {transfer_time*1000000:.1f}μs, {bandwidth:.2f} MB/s")
     
-    transfer_total_time = time.time() - transfer_start_time
+    transfer_total_time = (time.perf_counter_ns() - transfer_start_time) * 1e-9
     total_data = 2 * 512  # 2 iterations * 512 bytes
     total_bandwidth = (total_data / transfer_total_time) / (1024 * 1024)  # MB/s
     print(f"Transfer 1 total: {transfer_total_time*1000000:.1f}μs, {total_bandwidth:.2f} MB/s")
@@ -185,32 +198,16 @@ if __name__ == "__main__":
         print("Make prepped transfer failed.")
         exit()
 
-    transfer2_start = time.time()
+    transfer2_start = time.perf_counter_ns()
     state = nixl_agent2.transfer(xfer_handle_2)
     assert state != "ERR"
 
-    target_done = False
-    init_done = False
-
     print("Transfer 2 started")
 
-    while (not init_done) or (not target_done):
-        if not init_done:
-            state = nixl_agent2.check_xfer_state(xfer_handle_2)
-            if state == "ERR":
-                print("Transfer got to Error state.")
-                exit()
-            elif state == "DONE":
-                init_done = True
-                print("Initiator done")
-
-        if not target_done:
-            if nixl_agent1.check_remote_xfer_done("initiator", b"UUID2"):
-                target_done = True
-                print("Target done")
+    wait_for_xfer(nixl_agent2, nixl_agent1, xfer_handle_2, b"UUID2")
     
-    transfer2_end = time.time()
-    transfer2_time = transfer2_end - transfer2_start
+    transfer2_end = time.perf_counter_ns()
+    transfer2_time = (transfer2_end - transfer2_start) * 1e-9
     data_size = 512  # 2 buffers * 256 bytes each
     bandwidth = (data_size / transfer2_time) / (1024 * 1024)  # MB/s
     print(f"Transfer 2: {transfer2_time*1000000:.1f}μs, {bandwidth:.2f} MB/s")